@@ -22,9 +22,11 @@ from ops.relation import ConsumerBase, ProviderBase, ConsumerEvents
 
 LIBID = "abcdefg"
 LIBAPI = 1
-LIBPATCH = 0
+LIBPATCH = 1
 logger = logging.getLogger(__name__)
 
+_PASSWORD_ALPHABET = string.ascii_letters + string.digits
+
 
 class DeferEventError(Exception):
     def __init__(self, event, reason):
@@ -39,7 +41,7 @@ def status_catcher(func):
         try:
             func(self, *args, **kwargs)
         except DeferEventError as e:
-            logger.info("Deferring event: %s because: %s", str(e.event), e.reason)
+            logger.info("Deferring event: %s because: %s", e.event, e.reason)
             e.event.defer()
 
     return new_func
@@ -96,7 +98,7 @@ class CassandraConsumer(ConsumerBase):
 
         relation_data = rel.data[rel.app]
         creds_json = relation_data.get('credentials')
-        return json.loads(creds_json) if creds_json is not None else ()
+        return json.loads(creds_json) if creds_json else ()
 
     def databases(self, rel_id=None):
         """List of currently available databases
@@ -121,8 +123,8 @@ class CassandraConsumer(ConsumerBase):
         rel = self.framework.model.get_relation(self.relation_name, rel_id)
 
         if name_suffix:
-            name_suffix = "_{}".format(name_suffix)
-        db_name = "juju_db_{}_{}{}".format(sanitize_name(self.charm.model.name), sanitize_name(self.charm.app.name), sanitize_name(name_suffix))
+            name_suffix = f"_{name_suffix}"
+        db_name = f"juju_db_{sanitize_name(self.charm.model.name)}_{sanitize_name(self.charm.app.name)}{sanitize_name(name_suffix)}"
         # Cassandra does not allow keyspace names longer than 48 characters
         if len(db_name) > 48:
             raise NameLengthError("Database name can not be more than 48 characters")
@@ -145,8 +147,8 @@ class CassandraConsumer(ConsumerBase):
         return rel.data[rel.app].get("address")
 
     def _requested_databases(self, relation):
-        dbs_json = relation.data[self.charm.app].get("requested_databases", "[]")
-        return json.loads(dbs_json)
+        dbs_json = relation.data[self.charm.app].get("requested_databases")
+        return json.loads(dbs_json) if dbs_json else []
 
     def _set_requested_databases(self, relation, requested_databases):
         relation.data[self.charm.app]["requested_databases"] = json.dumps(requested_databases)
@@ -182,26 +184,24 @@ class CassandraProvider(ProviderBase):
 
     def update_port(self, relation_name, port):
         if self.charm.unit.is_leader():
+            port = str(port)
             for relation in self.charm.model.relations[relation_name]:
                 logger.info("Setting port data for relation %s", relation)
-                if str(port) != relation.data[self.charm.app].get(
-                    "port", None
-                ):
-                    relation.data[self.charm.app]["port"] = str(port)
+                if port != relation.data[self.charm.app].get("port", None):
+                    relation.data[self.charm.app]["port"] = port
 
     def update_address(self, relation_name, address):
         if self.charm.unit.is_leader():
+            address = str(address)
             for relation in self.charm.model.relations[relation_name]:
                 logger.info("Setting address data for relation %s", relation)
-                if str(address) != relation.data[self.charm.app].get(
-                    "address", None
-                ):
-                    relation.data[self.charm.app]["address"] = str(address)
+                if address != relation.data[self.charm.app].get("address", None):
+                    relation.data[self.charm.app]["address"] = address
 
     def credentials(self, rel_id):
         rel = self.framework.model.get_relation(self.name, rel_id)
-        creds_json = rel.data[self.charm.app].get("credentials", "[]")
-        return json.loads(creds_json)
+        creds_json = rel.data[self.charm.app].get("credentials")
+        return json.loads(creds_json) if creds_json else []
 
     def set_credentials(self, rel_id, creds):
         rel = self.framework.model.get_relation(self.name, rel_id)
@@ -209,15 +209,19 @@ class CassandraProvider(ProviderBase):
 
     def requested_databases(self, rel_id):
         rel = self.framework.model.get_relation(self.name, rel_id)
-        return json.loads(rel.data[rel.app].get("requested_databases", "[]"))
+        dbs_json = rel.data[rel.app].get("requested_databases")
+        return json.loads(dbs_json) if dbs_json else []
 
     def databases(self, rel_id):
         rel = self.framework.model.get_relation(self.name, rel_id)
-        return json.loads(rel.data[self.charm.app].get("databases") or "[]")
+        dbs_json = rel.data[self.charm.app].get("databases")
+        return json.loads(dbs_json) if dbs_json else []
 
     def set_databases(self, rel_id, dbs):
         rel = self.framework.model.get_relation(self.name, rel_id)
-        rel.data[self.charm.app]["databases"] = json.dumps(dbs)
+        dbs_json = json.dumps(dbs)
+        if dbs_json != rel.data[self.charm.app].get("databases"):
+            rel.data[self.charm.app]["databases"] = dbs_json
 
     def on_relation_changed(self, event):
         self.on.data_changed.emit(event.relation.id, event.app.name)
@@ -230,5 +234,4 @@ def sanitize_name(name):
 
 
 def generate_password():
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for i in range(20))
+    return "".join(secrets.choice(_PASSWORD_ALPHABET) for i in range(20))
@@ -181,10 +181,15 @@ class CassandraOperatorCharm(CharmBase):
 
         requested_dbs = self.provider.requested_databases(event.rel_id)
         dbs = self.provider.databases(event.rel_id)
+        existing_dbs = set(dbs)
+        new_dbs = []
         for db in requested_dbs:
-            if db not in dbs:
-                self._create_db(event, db, creds[0])
-                dbs.append(db)
+            if db not in existing_dbs:
+                new_dbs.append(db)
+                existing_dbs.add(db)
+        if new_dbs:
+            self._create_dbs(event, new_dbs, creds[0])
+            dbs.extend(new_dbs)
         self.provider.set_databases(event.rel_id, dbs)
 
     def _root_password(self, event):
@@ -213,10 +218,8 @@ class CassandraOperatorCharm(CharmBase):
             try:
                 session = cluster.connect()
             except NoHostAvailable as e:
-                logger.info("Caught exception %s:%s", type(e), e)
-                self.unit.status = MaintenanceStatus("Cassandra Starting")
-                raise DeferEventError(
-                    event, "Can't connect to database in _root_password()"
+                raise self._connection_error(
+                    event, e, "Can't connect to database in _root_password()"
                 )
             # Set system_auth replication here once we have pebble
             # See https://docs.datastax.com/en/cassandra-oss/3.0/cassandra/configuration/secureConfigNativeAuth.html
@@ -257,10 +260,8 @@ class CassandraOperatorCharm(CharmBase):
             try:
                 session = cluster.connect()
             except NoHostAvailable as e:
-                logger.info("Caught exception %s:%s", type(e), e)
-                self.unit.status = MaintenanceStatus("Cassandra Starting")
-                raise DeferEventError(
-                    event, "Can't connect to database in _root_password()"
+                raise self._connection_error(
+                    event, e, "Can't connect to database in _root_password()"
                 )
             random_password = generate_password()
             session.execute(
@@ -289,11 +290,14 @@ class CassandraOperatorCharm(CharmBase):
             session = cluster.connect()
             yield session
         except NoHostAvailable as e:
-            logger.info("Caught exception %s:%s", type(e), e)
-            self.unit.status = MaintenanceStatus("Cassandra Starting")
-            raise DeferEventError(event, "Can't connect to database")
+            raise self._connection_error(event, e, "Can't connect to database")
         finally:
-            cluster.shutdown
+            cluster.shutdown()
+
+    def _connection_error(self, event, error, reason):
+        logger.info("Caught exception %s:%s", type(error), error)
+        self.unit.status = MaintenanceStatus("Cassandra Starting")
+        return DeferEventError(event, reason)
 
     def _create_user(self, event, user, password):
         with self.database_connection(event) as conn:
@@ -301,13 +305,15 @@ class CassandraOperatorCharm(CharmBase):
                 f"CREATE ROLE IF NOT EXISTS '{user}' WITH PASSWORD = '{password}' AND LOGIN = true"
             )
 
-    def _create_db(self, event, db_name, user):
+    def _create_dbs(self, event, db_names, user):
+        replication_factor = self._goal_units()
         with self.database_connection(event) as conn:
-            # Review replication strategy
-            conn.execute(
-                f"CREATE KEYSPACE IF NOT EXISTS {db_name} WITH REPLICATION = {{ 'class' : 'SimpleStrategy', 'replication_factor' : {self._goal_units()} }}"
-            )
-            conn.execute(f"GRANT ALL PERMISSIONS ON KEYSPACE {db_name} to '{user}'")
+            for db_name in db_names:
+                # Review replication strategy
+                conn.execute(
+                    f"CREATE KEYSPACE IF NOT EXISTS {db_name} WITH REPLICATION = {{ 'class' : 'SimpleStrategy', 'replication_factor' : {replication_factor} }}"
+                )
+                conn.execute(f"GRANT ALL PERMISSIONS ON KEYSPACE {db_name} to '{user}'")
 
     def _configure(self, event):
         if self._num_units() != self._goal_units():
@@ -322,10 +328,10 @@ class CassandraOperatorCharm(CharmBase):
 
         needs_restart = False
 
-        conf = self._config_file(event)
+        conf = self._config(event)
         container = self.unit.get_container("cassandra")
-        if yaml.safe_load(container.pull(CONFIG_PATH).read()) != yaml.safe_load(conf):
-            container.push(CONFIG_PATH, conf)
+        if yaml.safe_load(container.pull(CONFIG_PATH).read()) != conf:
+            container.push(CONFIG_PATH, yaml.dump(conf))
             needs_restart = True
 
         layer = self._build_layer(event)
@@ -400,10 +406,10 @@ class CassandraOperatorCharm(CharmBase):
             else:
                 raise
 
-    def _config_file(self, event):
+    def _config(self, event):
         if (bind_address := self._bind_address()) is None:
             self.unit.status = MaintenanceStatus("Waiting for network address")
-            raise DeferEventError(event, "No ip address in _config_file()")
+            raise DeferEventError(event, "No ip address in _config()")
         conf = {
             "cluster_name": f"juju-cluster-{self.app.name}",
             "num_tokens": 256,
@@ -424,7 +430,7 @@ class CassandraOperatorCharm(CharmBase):
             "partitioner": "org.apache.cassandra.dht.Murmur3Partitioner",
             "endpoint_snitch": "GossipingPropertyFileSnitch",
         }
-        return yaml.dump(conf)
+        return conf
 
 
 if __name__ == "__main__":
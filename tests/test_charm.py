@@ -19,9 +19,10 @@ import yaml
 import cassandra.cluster
 import ops.model
 
+from charms.cassandra_k8s.v0.cassandra import CassandraConsumer, CassandraProvider
 from ops.testing import Harness
 from charm import CassandraOperatorCharm
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 class FakeConnection:
@@ -41,6 +42,21 @@ class FakeConnection:
         return self.responses.get(query)
 
 
+class RecordingConnection(FakeConnection):
+    def __init__(self, responses=None):
+        super().__init__(responses)
+        self.connections = 0
+        self.queries = []
+
+    def __call__(self, event=None):
+        self.connections += 1
+        return self
+
+    def execute(self, query, wildcards=None):
+        self.queries.append(query)
+        return super().execute(query, wildcards)
+
+
 SAMPLE_CONFIG = """authenticator: PasswordAuthenticator
 authorizer: CassandraAuthorizer
 cluster_name: juju-cluster-cassandra-k8s
@@ -177,3 +193,113 @@ class TestCharm(unittest.TestCase):
             ),
             ["1.1.1.1:7070"],
         )
+
+    def test_unchanged_databases_are_not_rewritten(self):
+        rel_id = self.harness.add_relation("database", "otherapp")
+        self.harness.add_relation_unit(rel_id, "otherapp/0")
+        self.harness.update_relation_data(
+            rel_id, "otherapp", {"requested_databases": '["db_name"]'}
+        )
+        setitem = ops.model.RelationDataContent.__setitem__
+        with patch.object(
+            ops.model.RelationDataContent,
+            "__setitem__",
+            autospec=True,
+            side_effect=setitem,
+        ) as patched_setitem:
+            self.harness.charm.provider.on.data_changed.emit(rel_id, "otherapp")
+        written_keys = [call.args[1] for call in patched_setitem.call_args_list]
+        self.assertNotIn("databases", written_keys)
+        data = self.harness.get_relation_data(rel_id, "cassandra-k8s")
+        self.assertEqual(json.loads(data["databases"]), ["db_name"])
+
+    def _provided_relation(self, databases=None):
+        # Pre-seed the root password and user credentials so the only
+        # connection made while handling the relation is for databases
+        peer_id = self.harness.charm.model.get_relation("cassandra-peers").id
+        self.harness.update_relation_data(
+            peer_id, "cassandra-k8s", {"root_password": "password"}
+        )
+        rel_id = self.harness.add_relation("database", "otherapp")
+        self.harness.add_relation_unit(rel_id, "otherapp/0")
+        data = {"credentials": json.dumps(["juju-user-otherapp", "password"])}
+        if databases is not None:
+            data["databases"] = json.dumps(databases)
+        self.harness.update_relation_data(rel_id, "cassandra-k8s", data)
+        return rel_id
+
+    def test_request_multiple_dbs(self):
+        rel_id = self._provided_relation()
+        conn = RecordingConnection()
+        with patch.object(cassandra.cluster.Cluster, "connect", new=conn):
+            self.harness.update_relation_data(
+                rel_id, "otherapp", {"requested_databases": '["a", "b", "a"]'}
+            )
+        data = self.harness.get_relation_data(rel_id, "cassandra-k8s")
+        self.assertEqual(json.loads(data["databases"]), ["a", "b"])
+        self.assertEqual(conn.connections, 1)
+        creates = [q for q in conn.queries if q.startswith("CREATE KEYSPACE")]
+        grants = [q for q in conn.queries if q.startswith("GRANT")]
+        self.assertEqual(len(creates), 2)
+        self.assertEqual(len(grants), 2)
+
+    def test_provided_db_is_not_recreated(self):
+        rel_id = self._provided_relation(databases=["a"])
+        conn = RecordingConnection()
+        with patch.object(cassandra.cluster.Cluster, "connect", new=conn):
+            self.harness.update_relation_data(
+                rel_id, "otherapp", {"requested_databases": '["a", "b"]'}
+            )
+        data = self.harness.get_relation_data(rel_id, "cassandra-k8s")
+        self.assertEqual(json.loads(data["databases"]), ["a", "b"])
+        creates = [q for q in conn.queries if q.startswith("CREATE KEYSPACE")]
+        self.assertEqual(len(creates), 1)
+        self.assertIn("CREATE KEYSPACE IF NOT EXISTS b ", creates[0])
+
+    @patch.object(cassandra.cluster.Cluster, "shutdown", autospec=True)
+    def test_database_connection_shuts_down_cluster(self, shutdown):
+        peer_id = self.harness.charm.model.get_relation("cassandra-peers").id
+        self.harness.update_relation_data(
+            peer_id, "cassandra-k8s", {"root_password": "password"}
+        )
+        self.harness.charm._create_user(None, "user", "password")
+        self.assertEqual(shutdown.call_count, 1)
+        self.harness.charm._create_dbs(None, ["a", "b"], "user")
+        self.assertEqual(shutdown.call_count, 2)
+
+    @patch("charm.restart")
+    def test_unchanged_config_is_not_rewritten(self, restart):
+        with patch.object(
+            ops.model.Container, "push", autospec=True, side_effect=fake_push
+        ) as push:
+            self.harness.update_config({"port": 9042})
+        push.assert_not_called()
+        restart.assert_not_called()
+
+
+def empty_relation_library(rel_data):
+    # Juju drops empty values, so the Harness cannot store "" in relation
+    # data. Hand the library methods a relation that returns it directly.
+    relation = MagicMock()
+    relation.data.__getitem__.return_value = rel_data
+    library = MagicMock()
+    library.framework.model.get_relation.return_value = relation
+    return library, relation
+
+
+class TestCassandraLibrary(unittest.TestCase):
+    def test_provider_reads_empty_values_as_empty(self):
+        provider, _ = empty_relation_library(
+            {"credentials": "", "requested_databases": "", "databases": ""}
+        )
+        self.assertEqual(CassandraProvider.credentials(provider, 0), [])
+        self.assertEqual(CassandraProvider.requested_databases(provider, 0), [])
+        self.assertEqual(CassandraProvider.databases(provider, 0), [])
+
+    def test_consumer_reads_empty_values_as_empty(self):
+        consumer, relation = empty_relation_library(
+            {"credentials": "", "requested_databases": "", "databases": ""}
+        )
+        self.assertEqual(CassandraConsumer.credentials(consumer), ())
+        self.assertEqual(CassandraConsumer.databases(consumer), [])
+        self.assertEqual(CassandraConsumer._requested_databases(consumer, relation), [])